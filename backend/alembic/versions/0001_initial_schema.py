@@ -0,0 +1,92 @@
+"""initial schema
+
+Matches what `Base.metadata.create_all` produced before migrations existed, so
+it only creates tables that are missing and is safe on those databases.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+JOB_STATUSES = ("APPLIED", "SCREENING", "INTERVIEWING", "OFFER", "REJECTED", "WITHDRAWN")
+
+# The PostgreSQL enum type is created once up front and shared by later tables
+job_status = sa.Enum(*JOB_STATUSES, name="jobstatus").with_variant(
+    postgresql.ENUM(*JOB_STATUSES, name="jobstatus", create_type=False), "postgresql"
+)
+
+
+def _pg_trgm_available(bind) -> bool:
+    # pg_trgm ships with contrib, which minimal PostgreSQL installs may lack
+    return bind.execute(
+        sa.text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+    ).first() is not None
+
+
+def upgrade():
+    bind = op.get_bind()
+    existing = set(sa.inspect(bind).get_table_names())
+    
+    if bind.dialect.name == "postgresql":
+        postgresql.ENUM(*JOB_STATUSES, name="jobstatus").create(bind, checkfirst=True)
+    
+    if "job_applications" not in existing:
+        op.create_table(
+            "job_applications",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("company", sa.String(255), nullable=False),
+            sa.Column("position", sa.String(255), nullable=False),
+            sa.Column("status", job_status, nullable=True),
+            sa.Column("location", sa.String(255), nullable=True),
+            sa.Column("salary_range", sa.String(100), nullable=True),
+            sa.Column("job_url", sa.Text(), nullable=True),
+            sa.Column("source", sa.String(100), nullable=True),
+            sa.Column("notes", sa.Text(), nullable=True),
+            sa.Column("email_id", sa.String(255), nullable=True, unique=True),
+            sa.Column("applied_date", sa.DateTime(), nullable=True),
+            sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=True),
+            sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=True),
+        )
+        op.create_index("ix_job_applications_id", "job_applications", ["id"])
+        op.create_index("ix_job_applications_company", "job_applications", ["company"])
+        
+        if bind.dialect.name == "postgresql" and _pg_trgm_available(bind):
+            # Trigram indexes let the ILIKE '%term%' search avoid sequential scans
+            op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+            for column in ("company", "position"):
+                op.create_index(
+                    f"ix_job_applications_{column}_trgm",
+                    "job_applications",
+                    [column],
+                    postgresql_using="gin",
+                    postgresql_ops={column: "gin_trgm_ops"},
+                )
+    
+    if "user_tokens" not in existing:
+        op.create_table(
+            "user_tokens",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("email", sa.String(255), nullable=False, unique=True),
+            sa.Column("access_token", sa.Text(), nullable=False),
+            sa.Column("refresh_token", sa.Text(), nullable=True),
+            sa.Column("token_expiry", sa.DateTime(), nullable=True),
+            sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=True),
+            sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=True),
+        )
+        op.create_index("ix_user_tokens_id", "user_tokens", ["id"])
+
+
+def downgrade():
+    op.drop_table("user_tokens")
+    op.drop_table("job_applications")
+    if op.get_bind().dialect.name == "postgresql":
+        postgresql.ENUM(name="jobstatus").drop(op.get_bind(), checkfirst=True)
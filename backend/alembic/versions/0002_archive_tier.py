@@ -0,0 +1,67 @@
+"""archive tier for closed applications
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+JOB_STATUSES = ("APPLIED", "SCREENING", "INTERVIEWING", "OFFER", "REJECTED", "WITHDRAWN")
+
+# Reuses the enum type created in 0001
+job_status = sa.Enum(*JOB_STATUSES, name="jobstatus").with_variant(
+    postgresql.ENUM(*JOB_STATUSES, name="jobstatus", create_type=False), "postgresql"
+)
+
+
+def _sqlite_table_sql(bind, table: str) -> str:
+    return bind.execute(
+        sa.text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {"name": table},
+    ).scalar() or ""
+
+
+def upgrade():
+    bind = op.get_bind()
+    existing = set(sa.inspect(bind).get_table_names())
+    
+    # Archived rows are restored under their original id, so SQLite must never
+    # hand out an id again once its row has moved to the archive
+    if bind.dialect.name == "sqlite" and "AUTOINCREMENT" not in _sqlite_table_sql(bind, "job_applications"):
+        with op.batch_alter_table(
+            "job_applications", recreate="always", table_kwargs={"sqlite_autoincrement": True}
+        ):
+            pass
+    
+    if "job_applications_archive" not in existing:
+        op.create_table(
+            "job_applications_archive",
+            sa.Column("id", sa.Integer(), primary_key=True, autoincrement=False),
+            sa.Column("company", sa.String(255), nullable=False),
+            sa.Column("position", sa.String(255), nullable=False),
+            sa.Column("status", job_status, nullable=True),
+            sa.Column("location", sa.String(255), nullable=True),
+            sa.Column("salary_range", sa.String(100), nullable=True),
+            sa.Column("job_url", sa.Text(), nullable=True),
+            sa.Column("source", sa.String(100), nullable=True),
+            sa.Column("notes", sa.Text(), nullable=True),
+            sa.Column("email_id", sa.String(255), nullable=True, unique=True),
+            sa.Column("applied_date", sa.DateTime(), nullable=True),
+            sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=True),
+            sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=True),
+            sa.Column("archived_at", sa.DateTime(), server_default=sa.func.now(), nullable=True),
+        )
+        op.create_index("ix_job_applications_archive_company", "job_applications_archive", ["company"])
+
+
+def downgrade():
+    # The SQLite AUTOINCREMENT rebuild is kept; it is harmless without the archive
+    op.drop_table("job_applications_archive")
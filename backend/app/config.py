@@ -6,11 +6,23 @@ class Settings(BaseSettings):
     app_name: str = "Job Tracker"
     database_url: str = "sqlite+aiosqlite:///./job_tracker.db"
     
+    # Connection pool settings (ignored for SQLite)
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_timeout: int = 30
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = True
+    db_statement_cache_size: int = 500
+    
     # Google OAuth settings
     google_client_id: str = ""
     google_client_secret: str = ""
     google_redirect_uri: str = "http://localhost:8000/auth/callback"
     
+    # Archive rejected/withdrawn applications untouched for this many days
+    archive_after_days: int = 30
+    archive_interval_seconds: int = 3600
+    
     # Frontend URL for CORS
     frontend_url: str = "http://localhost:5173"
     
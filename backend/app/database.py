@@ -1,18 +1,78 @@
+from pathlib import Path
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 from app.config import get_settings
 
 settings = get_settings()
 
-engine = create_async_engine(settings.database_url, echo=True)
+ALEMBIC_INI = Path(__file__).resolve().parent.parent / "alembic.ini"
+
+# PostgreSQL advisory lock keys: one for migrations and archiving, one that
+# orders change feed events across workers
+MAINTENANCE_LOCK_KEY = 74201
+EVENTS_LOCK_KEY = 74202
+
+
+def engine_options(database_url: str) -> dict:
+    """Pool and driver options for the configured backend."""
+    if make_url(database_url).get_backend_name() != "postgresql":
+        # aiosqlite allows a single writer, so pooling settings don't apply
+        return {}
+    
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "connect_args": {"prepared_statement_cache_size": settings.db_statement_cache_size},
+    }
+
+
+engine = create_async_engine(settings.database_url, echo=True, **engine_options(settings.database_url))
 async_session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 Base = declarative_base()
 
 
+def dialect_insert(model):
+    """INSERT construct with ON CONFLICT support for the active backend."""
+    if engine.dialect.name == "postgresql":
+        return postgresql.insert(model)
+    return sqlite.insert(model)
+
+
+async def advisory_xact_lock(db: AsyncSession, key: int, wait: bool = True) -> bool:
+    """Take a transaction-scoped PostgreSQL advisory lock; always granted elsewhere.
+    
+    With wait=False, returns whether the lock was free instead of blocking.
+    """
+    if db.bind.dialect.name != "postgresql":
+        return True
+    
+    function = "pg_advisory_xact_lock" if wait else "pg_try_advisory_xact_lock"
+    result = await db.execute(text(f"SELECT {function}(:key)"), {"key": key})
+    return wait or bool(result.scalar())
+
+
+def _run_migrations(connection):
+    config = Config(str(ALEMBIC_INI))
+    config.attributes["connection"] = connection
+    # Revisions only create what's missing, so databases from create_all upgrade too
+    command.upgrade(config, "head")
+
+
 async def init_db():
     async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+        if conn.dialect.name == "postgresql":
+            # Serialize migrations when several workers start at once
+            await conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": MAINTENANCE_LOCK_KEY})
+        await conn.run_sync(_run_migrations)
 
 
 async def get_db():
@@ -21,5 +81,3 @@ async def get_db():
             yield session
         finally:
             await session.close()
-
-
@@ -1,10 +1,14 @@
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from brotli_asgi import BrotliMiddleware
 
 from app.config import get_settings
 from app.database import init_db
 from app.routers import auth, jobs, gmail
+from app.services.archive import run_archiver
+from app.services.events import broker
 
 settings = get_settings()
 
@@ -13,8 +17,14 @@ settings = get_settings()
 async def lifespan(app: FastAPI):
     # Startup: initialize database
     await init_db()
+    await broker.start()
+    stop_archiver = asyncio.Event()
+    archiver = asyncio.create_task(run_archiver(stop_archiver))
     yield
-    # Shutdown: cleanup if needed
+    # Shutdown: let an in-progress archive run finish, then stop
+    stop_archiver.set()
+    await archiver
+    await broker.stop()
 
 
 app = FastAPI(
@@ -33,6 +43,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large responses (brotli, falling back to gzip)
+app.add_middleware(BrotliMiddleware, minimum_size=1000, excluded_handlers=["/jobs/events"])
+
 # Include routers
 app.include_router(auth.router)
 app.include_router(jobs.router)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, Enum as SQLEnum
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, Text, Enum as SQLEnum
 from sqlalchemy.sql import func
 from app.database import Base
 import enum
@@ -13,10 +13,9 @@ class JobStatus(str, enum.Enum):
     WITHDRAWN = "withdrawn"
 
 
-class JobApplication(Base):
-    __tablename__ = "job_applications"
+class JobApplicationColumns:
+    """Columns shared by the hot table and its archive."""
     
-    id = Column(Integer, primary_key=True, index=True)
     company = Column(String(255), nullable=False, index=True)
     position = Column(String(255), nullable=False)
     status = Column(SQLEnum(JobStatus), default=JobStatus.APPLIED)
@@ -31,6 +30,37 @@ class JobApplication(Base):
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
 
+class JobApplication(JobApplicationColumns, Base):
+    __tablename__ = "job_applications"
+    # Never reuse ids, so archived rows can be restored under their original id
+    __table_args__ = {"sqlite_autoincrement": True}
+    
+    id = Column(Integer, primary_key=True, index=True)
+
+
+class JobApplicationArchive(JobApplicationColumns, Base):
+    """Closed applications moved out of the hot table by the archiver."""
+    __tablename__ = "job_applications_archive"
+    
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    archived_at = Column(DateTime, server_default=func.now())
+
+
+# Statuses eligible for archiving
+CLOSED_STATUSES = (JobStatus.REJECTED, JobStatus.WITHDRAWN)
+
+
+class JobEvent(Base):
+    """Change feed entry; `version` orders events across every worker."""
+    __tablename__ = "job_events"
+    __table_args__ = {"sqlite_autoincrement": True}
+    
+    version = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True)
+    event = Column(String(20), nullable=False)  # created, updated, deleted, archived
+    payload = Column(Text, nullable=False)  # JSON
+    created_at = Column(DateTime, server_default=func.now())
+
+
 class UserToken(Base):
     __tablename__ = "user_tokens"
     
@@ -6,9 +6,11 @@ from googleapiclient.discovery import build
 from datetime import datetime
 
 from app.config import get_settings
-from app.database import get_db
+from app.database import get_db, dialect_insert
 from app.models import UserToken, JobApplication, JobStatus
 from app.services.parser import parse_job_email
+from app.services.events import publish_job_created
+from app.services.archive import email_already_synced
 
 router = APIRouter(prefix="/gmail", tags=["gmail"])
 settings = get_settings()
@@ -53,14 +55,11 @@ async def sync_emails(db: AsyncSession = Depends(get_db)):
         ).execute()
         
         messages = results.get("messages", [])
-        new_jobs = 0
+        new_jobs = []
         
         for msg in messages:
             # Check if we already processed this email
-            existing = await db.execute(
-                select(JobApplication).where(JobApplication.email_id == msg["id"])
-            )
-            if existing.scalar_one_or_none():
+            if await email_already_synced(db, msg["id"]):
                 continue
             
             # Get full message details
@@ -74,23 +73,28 @@ async def sync_emails(db: AsyncSession = Depends(get_db)):
             job_data = parse_job_email(full_msg)
             
             if job_data:
-                job = JobApplication(
+                # A concurrent sync may have inserted this email already
+                insert_job = dialect_insert(JobApplication).values(
                     company=job_data.get("company", "Unknown"),
                     position=job_data.get("position", "Unknown Position"),
                     status=job_data.get("status", JobStatus.APPLIED),
                     source=job_data.get("source"),
                     email_id=msg["id"],
                     applied_date=job_data.get("date"),
-                )
-                db.add(job)
-                new_jobs += 1
+                ).on_conflict_do_nothing(index_elements=["email_id"])
+                job = (await db.execute(insert_job.returning(JobApplication))).scalar_one_or_none()
+                if job:
+                    new_jobs.append(job)
         
+        # Recorded together at the end so the events lock isn't held across Gmail calls
+        for job in new_jobs:
+            await publish_job_created(db, job)
         await db.commit()
         
         return {
-            "message": f"Sync complete. Found {len(messages)} job emails, added {new_jobs} new applications.",
+            "message": f"Sync complete. Found {len(messages)} job emails, added {len(new_jobs)} new applications.",
             "emails_found": len(messages),
-            "new_applications": new_jobs,
+            "new_applications": len(new_jobs),
         }
         
     except Exception as e:
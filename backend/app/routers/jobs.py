@@ -1,61 +1,141 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Header
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, func, union_all
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm.exc import StaleDataError
 from typing import Optional
 
-from app.database import get_db
-from app.models import JobApplication, JobStatus
+from app.database import get_db, dialect_insert
+from app.models import JobApplication, JobApplicationArchive, JobStatus
 from app.schemas import (
     JobApplicationCreate,
     JobApplicationUpdate,
     JobApplicationResponse,
     JobApplicationList,
 )
+from app.services.events import (
+    broker,
+    latest_version,
+    publish_job_created,
+    publish_job_updated,
+    publish_job_deleted,
+)
+from app.services.archive import restore_job, email_already_synced
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
 
+LIST_FIELDS = [column.name for column in JobApplication.__table__.columns]
+
+
+def _list_fields(fields: Optional[str]) -> list[str]:
+    """Resolve the `fields` query parameter to column names, always including id."""
+    if not fields:
+        return list(LIST_FIELDS)
+    
+    names = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = [name for name in names if name not in LIST_FIELDS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+    
+    return ["id"] + [name for name in dict.fromkeys(names) if name != "id"]
+
+
+def _tier_query(model, names: list[str], status: Optional[JobStatus], search: Optional[str]):
+    """Select the given columns from one storage tier, applying the list filters."""
+    table = model.__table__
+    query = select(*[table.c[name] for name in names])
+    
+    if status:
+        query = query.where(table.c.status == status)
+    
+    if search:
+        search_term = f"%{search}%"
+        query = query.where(
+            (table.c.company.ilike(search_term)) |
+            (table.c.position.ilike(search_term))
+        )
+    
+    return query
+
 
-@router.get("", response_model=JobApplicationList)
+def _jobs_subquery(names: list[str], status, search, include_archived: bool):
+    """Hot table rows, unioned with the archive when requested."""
+    queries = [_tier_query(JobApplication, names, status, search)]
+    if include_archived:
+        queries.append(_tier_query(JobApplicationArchive, names, status, search))
+    
+    query = union_all(*queries) if len(queries) > 1 else queries[0]
+    return query.subquery()
+
+
+@router.get("", response_class=ORJSONResponse, responses={200: {"model": JobApplicationList}})
 async def get_jobs(
     db: AsyncSession = Depends(get_db),
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
     status: Optional[JobStatus] = None,
     search: Optional[str] = None,
+    fields: Optional[str] = Query(
+        None, description="Comma-separated columns to return, e.g. company,position,status"
+    ),
+    include_archived: bool = False,
 ):
-    """Get all job applications with optional filtering."""
-    query = select(JobApplication)
+    """Get all job applications with optional filtering.
     
-    if status:
-        query = query.where(JobApplication.status == status)
-    
-    if search:
-        search_term = f"%{search}%"
-        query = query.where(
-            (JobApplication.company.ilike(search_term)) |
-            (JobApplication.position.ilike(search_term))
-        )
+    Rows are returned as plain dicts of the projected columns; JobApplicationList
+    documents the shape but is not used to validate them.
+    """
+    names = _list_fields(fields)
+    # Taken before reading so clients resuming from it can't miss a change
+    version = await latest_version(db)
     
     # Get total count
-    count_query = select(func.count()).select_from(query.subquery())
+    count_query = select(func.count()).select_from(
+        _jobs_subquery(["id"], status, search, include_archived)
+    )
     total_result = await db.execute(count_query)
     total = total_result.scalar()
     
-    # Get paginated results
-    query = query.order_by(JobApplication.applied_date.desc()).offset(skip).limit(limit)
+    # Get paginated results, sorting on applied_date even when it isn't projected
+    sort_names = names if "applied_date" in names else names + ["applied_date"]
+    jobs = _jobs_subquery(sort_names, status, search, include_archived)
+    query = (
+        select(*[jobs.c[name] for name in names])
+        .order_by(jobs.c.applied_date.desc())
+        .offset(skip)
+        .limit(limit)
+    )
     result = await db.execute(query)
-    jobs = result.scalars().all()
+    items = [dict(row) for row in result.mappings()]
     
-    return JobApplicationList(items=jobs, total=total)
+    # Rows come straight from the selected columns, so skip per-row model validation
+    return ORJSONResponse({"items": items, "total": total, "version": version})
+
+
+@router.get("/events")
+async def job_events(
+    last_event_id: Optional[int] = Header(None),
+    since: Optional[int] = Query(None, alias="last_event_id"),
+):
+    """Stream job changes as Server-Sent Events.
+    
+    The first connection resumes from the `last_event_id` query parameter (the
+    `version` returned by GET /jobs); reconnects send the Last-Event-ID header,
+    which takes precedence.
+    """
+    resume_from = last_event_id if last_event_id is not None else since
+    return StreamingResponse(
+        broker.subscribe(resume_from),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.get("/{job_id}", response_model=JobApplicationResponse)
 async def get_job(job_id: int, db: AsyncSession = Depends(get_db)):
-    """Get a specific job application by ID."""
-    result = await db.execute(
-        select(JobApplication).where(JobApplication.id == job_id)
-    )
-    job = result.scalar_one_or_none()
+    """Get a specific job application by ID, from either tier."""
+    job = await db.get(JobApplication, job_id) or await db.get(JobApplicationArchive, job_id)
     
     if not job:
         raise HTTPException(status_code=404, detail="Job application not found")
@@ -66,10 +146,20 @@ async def get_job(job_id: int, db: AsyncSession = Depends(get_db)):
 @router.post("", response_model=JobApplicationResponse)
 async def create_job(job: JobApplicationCreate, db: AsyncSession = Depends(get_db)):
     """Create a new job application."""
-    db_job = JobApplication(**job.model_dump())
-    db.add(db_job)
+    # ON CONFLICT only sees the hot table, so check the archive explicitly
+    if job.email_id and await email_already_synced(db, job.email_id):
+        raise HTTPException(status_code=409, detail="A job application for this email already exists")
+    
+    insert_job = dialect_insert(JobApplication).values(**job.model_dump()).on_conflict_do_nothing(
+        index_elements=["email_id"]
+    )
+    db_job = (await db.execute(insert_job.returning(JobApplication))).scalar_one_or_none()
+    
+    if not db_job:
+        raise HTTPException(status_code=409, detail="A job application for this email already exists")
+    
+    await publish_job_created(db, db_job)
     await db.commit()
-    await db.refresh(db_job)
     return db_job
 
 
@@ -79,36 +169,49 @@ async def update_job(
     job_update: JobApplicationUpdate,
     db: AsyncSession = Depends(get_db),
 ):
-    """Update a job application."""
-    result = await db.execute(
-        select(JobApplication).where(JobApplication.id == job_id)
-    )
-    job = result.scalar_one_or_none()
+    """Update a job application, restoring it from the archive if needed."""
+    job = await db.get(JobApplication, job_id)
     
     if not job:
-        raise HTTPException(status_code=404, detail="Job application not found")
+        archived = await db.get(JobApplicationArchive, job_id)
+        if not archived:
+            raise HTTPException(status_code=404, detail="Job application not found")
+        if archived.email_id and await email_already_synced(db, archived.email_id, hot_only=True):
+            raise HTTPException(
+                status_code=409, detail="Another job application for this email already exists"
+            )
+        job = await restore_job(db, archived)
     
     update_data = job_update.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(job, field, value)
     
-    await db.commit()
+    try:
+        await db.flush()
+    except StaleDataError:
+        # Deleted by a concurrent request since we loaded it
+        raise HTTPException(status_code=404, detail="Job application not found")
+    except IntegrityError:
+        # A restored row's email_id was inserted concurrently
+        raise HTTPException(
+            status_code=409, detail="Another job application for this email already exists"
+        )
     await db.refresh(job)
+    await publish_job_updated(db, job)
+    await db.commit()
     return job
 
 
 @router.delete("/{job_id}")
 async def delete_job(job_id: int, db: AsyncSession = Depends(get_db)):
-    """Delete a job application."""
-    result = await db.execute(
-        select(JobApplication).where(JobApplication.id == job_id)
-    )
-    job = result.scalar_one_or_none()
+    """Delete a job application from either tier."""
+    job = await db.get(JobApplication, job_id) or await db.get(JobApplicationArchive, job_id)
     
     if not job:
         raise HTTPException(status_code=404, detail="Job application not found")
     
     await db.delete(job)
+    await publish_job_deleted(db, job_id)
     await db.commit()
     return {"message": "Job application deleted"}
 
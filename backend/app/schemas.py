@@ -42,8 +42,26 @@ class JobApplicationResponse(JobApplicationBase):
         from_attributes = True
 
 
+class JobApplicationListItem(BaseModel):
+    """Lightweight list row - only the columns requested via `fields` are present."""
+    id: int
+    company: Optional[str] = None
+    position: Optional[str] = None
+    status: Optional[JobStatus] = None
+    location: Optional[str] = None
+    salary_range: Optional[str] = None
+    job_url: Optional[str] = None
+    source: Optional[str] = None
+    notes: Optional[str] = None
+    email_id: Optional[str] = None
+    applied_date: Optional[datetime] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
 class JobApplicationList(BaseModel):
-    items: list[JobApplicationResponse]
+    items: list[JobApplicationListItem]
     total: int
+    version: int  # change feed position the list was read at
 
 
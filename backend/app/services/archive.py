@@ -0,0 +1,108 @@
+import asyncio
+import logging
+
+from sqlalchemy import select, insert, delete, exists, func, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.database import async_session_maker, advisory_xact_lock, MAINTENANCE_LOCK_KEY
+from app.models import JobApplication, JobApplicationArchive, CLOSED_STATUSES
+from app.services.events import publish_jobs_archived, prune_events
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Column names present in both tiers
+JOB_COLUMNS = [column.name for column in JobApplication.__table__.columns]
+
+# Rows moved per transaction, keeping statements well under bind-parameter limits
+ARCHIVE_BATCH_SIZE = 500
+
+
+async def email_already_synced(db: AsyncSession, email_id: str, hot_only: bool = False) -> bool:
+    """Check the hot table, and unless `hot_only` the archive, for an imported email."""
+    query = select(JobApplication.id).where(JobApplication.email_id == email_id)
+    if not hot_only:
+        query = union_all(
+            query,
+            select(JobApplicationArchive.id).where(JobApplicationArchive.email_id == email_id),
+        )
+    result = await db.execute(query.limit(1))
+    return result.first() is not None
+
+
+def _days_ago(dialect: str, days: int):
+    """`now() - days` on the database clock, which also writes updated_at."""
+    if dialect == "postgresql":
+        return func.now() - func.make_interval(0, 0, 0, days)
+    # SQLite's CURRENT_TIMESTAMP is UTC
+    return func.datetime("now", f"{-days:+d} days")
+
+
+async def archive_closed_jobs(db: AsyncSession, older_than_days: int) -> list[int]:
+    """Move closed applications not updated within `older_than_days` to the archive."""
+    hot = JobApplication.__table__
+    archive = JobApplicationArchive.__table__
+    stale = (
+        hot.c.status.in_(CLOSED_STATUSES)
+        & (hot.c.updated_at < _days_ago(db.bind.dialect.name, older_than_days))
+        # A duplicate email_id (created while its twin sat in the archive) can't be
+        # archived; leave it hot rather than failing every batch on the unique index
+        & ~exists().where(archive.c.email_id == hot.c.email_id)
+    )
+    
+    archived_ids = []
+    while True:
+        # Only one worker archives at a time; the others skip this round
+        if not await advisory_xact_lock(db, MAINTENANCE_LOCK_KEY, wait=False):
+            await db.rollback()
+            break
+        
+        # Delete a bounded batch, re-checking `stale` so rows reopened meanwhile stay put,
+        # and copy exactly the rows that were deleted
+        batch = select(hot.c.id).where(stale).limit(ARCHIVE_BATCH_SIZE)
+        result = await db.execute(
+            delete(hot).where(hot.c.id.in_(batch), stale).returning(*hot.c)
+        )
+        rows = [dict(row) for row in result.mappings()]
+        if not rows:
+            await db.commit()
+            break
+        
+        batch_ids = [row["id"] for row in rows]
+        await db.execute(insert(JobApplicationArchive.__table__), rows)
+        await publish_jobs_archived(db, batch_ids)
+        await db.commit()
+        archived_ids.extend(batch_ids)
+    
+    return archived_ids
+
+
+async def restore_job(db: AsyncSession, archived: JobApplicationArchive) -> JobApplication:
+    """Move an archived application back into the hot table, keeping its id."""
+    # updated_at is left to the server default so the row isn't re-archived straight away
+    job = JobApplication(**{
+        name: getattr(archived, name) for name in JOB_COLUMNS if name != "updated_at"
+    })
+    await db.delete(archived)
+    db.add(job)
+    return job
+
+
+async def run_archiver(stop: asyncio.Event):
+    """Periodically archive closed applications and prune old events until `stop` is set."""
+    while not stop.is_set():
+        try:
+            async with async_session_maker() as db:
+                archived = await archive_closed_jobs(db, settings.archive_after_days)
+                await prune_events(db)
+                await db.commit()
+            if archived:
+                logger.info("Archived %d closed job applications", len(archived))
+        except Exception:
+            logger.exception("Archiving closed job applications failed")
+        
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=settings.archive_interval_seconds)
+        except asyncio.TimeoutError:
+            pass
@@ -0,0 +1,210 @@
+import asyncio
+import json
+import logging
+from contextlib import suppress
+from typing import AsyncIterator, Optional
+
+from sqlalchemy import event as orm_event, select, delete, func, text
+from sqlalchemy.ext.asyncio import AsyncSession, AsyncConnection
+from sqlalchemy.orm import Session
+
+from app.database import engine, async_session_maker, advisory_xact_lock, EVENTS_LOCK_KEY
+from app.models import JobApplication, JobEvent
+from app.schemas import JobApplicationResponse
+
+logger = logging.getLogger(__name__)
+
+# How many past events are kept for clients resuming with Last-Event-ID
+HISTORY_SIZE = 1000
+
+# Seconds between keep-alive comments on an idle stream
+KEEPALIVE_INTERVAL = 15
+
+# Seconds between checks for new events when no notification arrives
+POLL_INTERVAL = 5
+
+# PostgreSQL NOTIFY channel announcing new rows in job_events
+NOTIFY_CHANNEL = "job_events"
+
+# Session.info flag marking a transaction that recorded events
+PENDING_KEY = "job_events_pending"
+
+
+class JobEventBroker:
+    """Fans out job changes recorded in the job_events table.
+
+    Events are written in the same transaction as the change they describe, so
+    versions come from the database and are shared by every worker. Each process
+    tails the table and pushes new rows to its own SSE subscribers, woken by local
+    commits, by PostgreSQL NOTIFY from other workers, or by a slow poll.
+    """
+
+    def __init__(self):
+        self.version = 0  # latest version fanned out by this process
+        self.subscribers: set[asyncio.Queue] = set()
+        self._wakeup = asyncio.Event()
+        self._pump: Optional[asyncio.Task] = None
+        self._listener: Optional[AsyncConnection] = None
+
+    async def start(self):
+        """Begin tailing the event table from its current end."""
+        async with async_session_maker() as db:
+            self.version = await latest_version(db)
+
+        if engine.dialect.name == "postgresql":
+            self._listener = await engine.connect()
+            raw = await self._listener.get_raw_connection()
+            await raw.driver_connection.add_listener(NOTIFY_CHANNEL, lambda *args: self.wake())
+
+        self._pump = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._pump:
+            self._pump.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._pump
+            self._pump = None
+        if self._listener:
+            await self._listener.close()
+            self._listener = None
+
+    def wake(self):
+        """Ask the pump to look for new events."""
+        self._wakeup.set()
+
+    async def _run(self):
+        while True:
+            with suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=POLL_INTERVAL)
+            self._wakeup.clear()
+            try:
+                await self._fan_out()
+            except Exception:
+                logger.exception("Reading job events failed")
+
+    async def _fan_out(self):
+        async with async_session_maker() as db:
+            entries = await read_events(db, after=self.version)
+        for entry in entries:
+            self.version = entry[0]
+            for queue in self.subscribers:
+                queue.put_nowait(entry)
+
+    async def _replay(self, last_event_id: int) -> Optional[list[tuple[int, str, dict]]]:
+        """Events after last_event_id, or None if the history no longer covers it."""
+        async with async_session_maker() as db:
+            oldest, latest = (
+                await db.execute(select(func.min(JobEvent.version), func.max(JobEvent.version)))
+            ).one()
+            if last_event_id > (latest or 0):
+                # Version from another database, or one that was reset
+                return None
+            if oldest is not None and last_event_id < oldest - 1:
+                # Pruned past the client's position
+                return None
+            return await read_events(db, after=last_event_id)
+
+    async def subscribe(self, last_event_id: Optional[int] = None) -> AsyncIterator[str]:
+        """Yield SSE-formatted messages, replaying missed events first."""
+        queue: asyncio.Queue = asyncio.Queue()
+        self.subscribers.add(queue)
+        try:
+            # Registered before replaying, so skip anything already sent
+            sent = last_event_id
+            if last_event_id is not None:
+                missed = await self._replay(last_event_id)
+                if missed is None:
+                    async with async_session_maker() as db:
+                        sent = await latest_version(db)
+                    yield format_event(sent, "reset", {})
+                else:
+                    for entry in missed:
+                        sent = entry[0]
+                        yield format_event(*entry)
+
+            while True:
+                try:
+                    entry = await asyncio.wait_for(queue.get(), timeout=KEEPALIVE_INTERVAL)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                if sent is not None and entry[0] <= sent:
+                    continue
+                yield format_event(*entry)
+        finally:
+            self.subscribers.discard(queue)
+
+
+def format_event(version: int, event: str, data: dict) -> str:
+    """Serialize an event in Server-Sent Events wire format."""
+    return f"id: {version}\nevent: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+def serialize_job(job: JobApplication) -> dict:
+    """Convert a job row into the JSON payload carried by an event."""
+    return JobApplicationResponse.model_validate(job).model_dump(mode="json")
+
+
+async def latest_version(db: AsyncSession) -> int:
+    result = await db.execute(select(func.coalesce(func.max(JobEvent.version), 0)))
+    return result.scalar()
+
+
+async def read_events(db: AsyncSession, after: int) -> list[tuple[int, str, dict]]:
+    result = await db.execute(
+        select(JobEvent).where(JobEvent.version > after).order_by(JobEvent.version)
+    )
+    return [(row.version, row.event, json.loads(row.payload)) for row in result.scalars()]
+
+
+async def prune_events(db: AsyncSession):
+    """Drop events older than the replay history."""
+    cutoff = await latest_version(db) - HISTORY_SIZE
+    await db.execute(delete(JobEvent).where(JobEvent.version <= cutoff))
+
+
+async def record_event(db: AsyncSession, event: str, data: dict):
+    """Add an event to the current transaction; subscribers see it once committed.
+
+    On PostgreSQL the events lock is held until commit, so versions become
+    visible in order and tailing readers never skip one.
+    """
+    # Take row locks for pending changes before the events lock; every writer
+    # acquiring them in the same order is what keeps them from deadlocking
+    await db.flush()
+    if not db.info.get(PENDING_KEY):
+        await advisory_xact_lock(db, EVENTS_LOCK_KEY)
+        if db.bind.dialect.name == "postgresql":
+            await db.execute(text("SELECT pg_notify(:channel, '')"), {"channel": NOTIFY_CHANNEL})
+        db.info[PENDING_KEY] = True
+    db.add(JobEvent(event=event, payload=json.dumps(data)))
+
+
+@orm_event.listens_for(Session, "after_commit")
+def _wake_after_commit(session):
+    if session.info.pop(PENDING_KEY, False):
+        broker.wake()
+
+
+@orm_event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session):
+    session.info.pop(PENDING_KEY, None)
+
+
+broker = JobEventBroker()
+
+
+async def publish_job_created(db: AsyncSession, job: JobApplication):
+    await record_event(db, "created", serialize_job(job))
+
+
+async def publish_job_updated(db: AsyncSession, job: JobApplication):
+    await record_event(db, "updated", serialize_job(job))
+
+
+async def publish_job_deleted(db: AsyncSession, job_id: int):
+    await record_event(db, "deleted", {"id": job_id})
+
+
+async def publish_jobs_archived(db: AsyncSession, job_ids: list[int]):
+    await record_event(db, "archived", {"ids": job_ids})
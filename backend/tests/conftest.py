@@ -0,0 +1,72 @@
+"""Shared fixtures.
+
+The suite runs against TEST_DATABASE_URL, defaulting to a throwaway SQLite file.
+To cover PostgreSQL, point it at a locally started server, e.g.
+
+    TEST_DATABASE_URL=postgresql+asyncpg://postgres@localhost/job_tracker_test pytest
+
+The database is wiped before every test.
+"""
+import os
+import tempfile
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL") or (
+    f"sqlite+aiosqlite:///{tempfile.mkdtemp()}/job_tracker_test.db"
+)
+# Must be set before app.config builds its settings
+os.environ["DATABASE_URL"] = TEST_DATABASE_URL
+
+import httpx
+import pytest
+from sqlalchemy import MetaData
+
+from app.database import engine, init_db, async_session_maker
+from app.main import app
+from app.services.events import broker as event_broker
+
+
+def _drop_everything(connection):
+    metadata = MetaData()
+    metadata.reflect(connection)
+    metadata.drop_all(connection)
+    if connection.dialect.name == "postgresql":
+        connection.exec_driver_sql("DROP TYPE IF EXISTS jobstatus")
+
+
+@pytest.fixture
+def dialect() -> str:
+    return engine.dialect.name
+
+
+@pytest.fixture
+async def empty_db():
+    """A database with no tables at all."""
+    async with engine.begin() as conn:
+        await conn.run_sync(_drop_everything)
+    yield
+
+
+@pytest.fixture
+async def migrated_db(empty_db):
+    await init_db()
+    yield
+
+
+@pytest.fixture
+async def db(migrated_db):
+    async with async_session_maker() as session:
+        yield session
+
+
+@pytest.fixture
+async def client(migrated_db):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture
+async def broker(migrated_db):
+    await event_broker.start()
+    yield event_broker
+    await event_broker.stop()
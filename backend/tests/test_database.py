@@ -0,0 +1,151 @@
+import pytest
+from sqlalchemy import (
+    Column, DateTime, Enum as SQLEnum, Integer, MetaData, String, Table, Text, inspect, text,
+)
+from sqlalchemy.sql import func
+
+from app.config import get_settings
+from app.database import engine, engine_options, init_db, async_session_maker
+from app.models import JobApplication, JobStatus
+from app.services.archive import archive_closed_jobs
+
+HEAD = "0003"
+TABLES = {"alembic_version", "job_applications", "job_applications_archive", "job_events", "user_tokens"}
+
+
+def baseline_metadata() -> MetaData:
+    """The schema `create_all` produced before migrations existed."""
+    metadata = MetaData()
+    Table(
+        "job_applications", metadata,
+        Column("id", Integer, primary_key=True, index=True),
+        Column("company", String(255), nullable=False, index=True),
+        Column("position", String(255), nullable=False),
+        Column("status", SQLEnum(JobStatus), default=JobStatus.APPLIED),
+        Column("location", String(255)),
+        Column("salary_range", String(100)),
+        Column("job_url", Text),
+        Column("source", String(100)),
+        Column("notes", Text),
+        Column("email_id", String(255), unique=True),
+        Column("applied_date", DateTime),
+        Column("created_at", DateTime, server_default=func.now()),
+        Column("updated_at", DateTime, server_default=func.now()),
+    )
+    Table(
+        "user_tokens", metadata,
+        Column("id", Integer, primary_key=True, index=True),
+        Column("email", String(255), unique=True, nullable=False),
+        Column("access_token", Text, nullable=False),
+        Column("refresh_token", Text),
+        Column("token_expiry", DateTime),
+        Column("created_at", DateTime, server_default=func.now()),
+        Column("updated_at", DateTime, server_default=func.now()),
+    )
+    return metadata
+
+
+async def schema_state():
+    async with engine.connect() as conn:
+        tables = set(await conn.run_sync(lambda sync: inspect(sync).get_table_names()))
+        version = (await conn.execute(text("SELECT version_num FROM alembic_version"))).scalar()
+    return tables, version
+
+
+async def create_baseline_database(stamp=None):
+    async with engine.begin() as conn:
+        await conn.run_sync(baseline_metadata().create_all)
+        await conn.execute(text(
+            "INSERT INTO job_applications (company, position, status, email_id) "
+            "VALUES ('Legacy', 'Engineer', 'REJECTED', 'legacy-email')"
+        ))
+        if stamp:
+            await conn.execute(text("CREATE TABLE alembic_version (version_num VARCHAR(32) PRIMARY KEY)"))
+            await conn.execute(text("INSERT INTO alembic_version VALUES (:v)"), {"v": stamp})
+
+
+async def test_migrations_on_fresh_database(empty_db):
+    await init_db()
+    
+    tables, version = await schema_state()
+    assert TABLES <= tables
+    assert version == HEAD
+
+
+async def test_migrations_are_idempotent(empty_db):
+    await init_db()
+    await init_db()
+    
+    assert (await schema_state())[1] == HEAD
+
+
+async def test_migrations_upgrade_create_all_database(empty_db, dialect):
+    await create_baseline_database()
+    
+    await init_db()
+    
+    tables, version = await schema_state()
+    assert TABLES <= tables
+    assert version == HEAD
+    async with async_session_maker() as db:
+        legacy = await db.get(JobApplication, 1)
+        assert legacy.company == "Legacy"
+        assert legacy.status == JobStatus.REJECTED
+    
+    if dialect == "sqlite":
+        async with engine.connect() as conn:
+            sql = (await conn.execute(text(
+                "SELECT sql FROM sqlite_master WHERE name = 'job_applications'"
+            ))).scalar()
+        assert "AUTOINCREMENT" in sql
+
+
+async def test_migrations_repair_database_stamped_without_archive(empty_db):
+    await create_baseline_database(stamp="0001")
+    
+    await init_db()
+    
+    tables, version = await schema_state()
+    assert TABLES <= tables
+    assert version == HEAD
+
+
+async def test_archived_ids_are_not_reused_after_upgrade(empty_db):
+    await create_baseline_database()
+    await init_db()
+    
+    async with async_session_maker() as db:
+        # The legacy row is the highest id; once archived it must not be handed out again
+        assert await archive_closed_jobs(db, older_than_days=-1) == [1]
+        job = JobApplication(company="New", position="Engineer")
+        db.add(job)
+        await db.commit()
+        assert job.id != 1
+
+
+def test_engine_options_for_postgresql():
+    settings = get_settings()
+    
+    options = engine_options("postgresql+asyncpg://user@localhost/jobs")
+    
+    assert options["pool_size"] == settings.db_pool_size
+    assert options["max_overflow"] == settings.db_max_overflow
+    assert options["pool_timeout"] == settings.db_pool_timeout
+    assert options["pool_recycle"] == settings.db_pool_recycle
+    assert options["pool_pre_ping"] is settings.db_pool_pre_ping
+    assert options["connect_args"] == {
+        "prepared_statement_cache_size": settings.db_statement_cache_size
+    }
+
+
+def test_engine_options_for_sqlite():
+    assert engine_options("sqlite+aiosqlite:///./job_tracker.db") == {}
+
+
+def test_engine_uses_pool_options(dialect):
+    if dialect != "postgresql":
+        pytest.skip("pooling only applies to PostgreSQL")
+    settings = get_settings()
+    assert engine.pool.size() == settings.db_pool_size
+    assert engine.pool._max_overflow == settings.db_max_overflow
+    assert engine.pool._pre_ping is settings.db_pool_pre_ping
@@ -0,0 +1,87 @@
+import asyncio
+import pytest
+
+from app.services.events import broker as event_broker
+
+
+async def next_message(stream) -> str:
+    return await asyncio.wait_for(anext(stream), timeout=10)
+
+
+async def test_list_version_resumes_feed(client):
+    version = (await client.get("/jobs")).json()["version"]
+    await client.post("/jobs", json={"company": "Acme", "position": "Engineer"})
+    
+    stream = event_broker.subscribe(version)
+    try:
+        message = await next_message(stream)
+    finally:
+        await stream.aclose()
+    
+    assert message.startswith(f"id: {version + 1}\nevent: created\n")
+    assert '"company": "Acme"' in message
+
+
+async def test_unknown_version_resets(client):
+    stream = event_broker.subscribe(1000)
+    try:
+        message = await next_message(stream)
+    finally:
+        await stream.aclose()
+    
+    assert "event: reset" in message
+
+
+async def test_live_events_in_commit_order(client, broker):
+    stream = broker.subscribe()
+    # Start reading first so the subscription is registered before anything changes
+    reader = asyncio.create_task(next_message(stream))
+    await asyncio.sleep(0.1)
+    try:
+        created = await client.post("/jobs", json={"company": "Acme", "position": "Engineer"})
+        job_id = created.json()["id"]
+        await client.patch(f"/jobs/{job_id}", json={"status": "offer"})
+        await client.delete(f"/jobs/{job_id}")
+        
+        messages = [await reader] + [await next_message(stream) for _ in range(2)]
+    finally:
+        await stream.aclose()
+    
+    versions = [int(message.split("\n")[0].removeprefix("id: ")) for message in messages]
+    assert versions == sorted(versions)
+    assert [message.split("\n")[1] for message in messages] == [
+        "event: created", "event: updated", "event: deleted",
+    ]
+    assert (await client.get("/jobs")).json()["version"] == versions[-1]
+
+
+async def test_events_lock_taken_after_pending_changes_flush(client, db, monkeypatch):
+    from app.services import events
+    
+    created = await client.post("/jobs", json={"company": "Acme", "position": "Engineer"})
+    job_id = created.json()["id"]
+    unflushed = []
+    
+    async def spy_lock(session, key, wait=True):
+        # Row locks must already be held, i.e. nothing left to flush
+        unflushed.append(bool(session.new or session.dirty or session.deleted))
+        return True
+    
+    monkeypatch.setattr(events, "advisory_xact_lock", spy_lock)
+    await client.patch(f"/jobs/{job_id}", json={"notes": "changed"})
+    await client.delete(f"/jobs/{job_id}")
+    
+    assert unflushed == [False, False]
+
+
+async def test_concurrent_update_and_delete_do_not_deadlock(client, dialect):
+    if dialect != "postgresql":
+        pytest.skip("SQLite serializes writers")
+    
+    for _ in range(20):
+        job_id = (await client.post("/jobs", json={"company": "Acme", "position": "Engineer"})).json()["id"]
+        responses = await asyncio.gather(
+            client.patch(f"/jobs/{job_id}", json={"notes": "changed"}),
+            client.delete(f"/jobs/{job_id}"),
+        )
+        assert {response.status_code for response in responses} <= {200, 404}
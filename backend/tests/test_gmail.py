@@ -0,0 +1,86 @@
+import pytest
+
+from app.models import JobApplication, JobApplicationArchive, JobStatus
+from app.routers import gmail
+
+
+class FakeRequest:
+    def __init__(self, result):
+        self.result = result
+    
+    def execute(self):
+        return self.result
+
+
+class FakeGmail:
+    """Just enough of the Gmail API client for sync_emails."""
+    
+    def __init__(self, message_ids):
+        self.message_ids = message_ids
+    
+    def users(self):
+        return self
+    
+    def messages(self):
+        return self
+    
+    def list(self, **kwargs):
+        return FakeRequest({"messages": [{"id": message_id} for message_id in self.message_ids]})
+    
+    def get(self, userId, id, format):
+        return FakeRequest({"id": id})
+
+
+@pytest.fixture
+def inbox(monkeypatch):
+    message_ids = []
+    
+    async def fake_service(db):
+        return FakeGmail(message_ids)
+    
+    monkeypatch.setattr(gmail, "get_gmail_service", fake_service)
+    monkeypatch.setattr(gmail, "parse_job_email", lambda message: {
+        "company": f"Company {message['id']}",
+        "position": "Engineer",
+        "status": JobStatus.APPLIED,
+    })
+    return message_ids
+
+
+async def test_sync_adds_each_email_once(client, inbox):
+    inbox.extend(["msg-1", "msg-2"])
+    
+    first = (await client.get("/gmail/sync")).json()
+    second = (await client.get("/gmail/sync")).json()
+    
+    assert first["new_applications"] == 2
+    assert second["new_applications"] == 0
+    assert (await client.get("/jobs")).json()["total"] == 2
+
+
+async def test_sync_skips_emails_already_archived(client, db, inbox):
+    db.add(JobApplicationArchive(id=10, company="Old", position="Engineer", email_id="msg-1"))
+    await db.commit()
+    inbox.extend(["msg-1", "msg-2"])
+    
+    body = (await client.get("/gmail/sync")).json()
+    
+    assert body["new_applications"] == 1
+
+
+async def test_sync_insert_ignores_conflicting_email(client, db, inbox, monkeypatch):
+    # Simulate a concurrent sync inserting the row after our dedup check
+    db.add(JobApplication(company="Concurrent", position="Engineer", email_id="msg-1"))
+    await db.commit()
+    
+    async def not_synced(db, email_id):
+        return False
+    
+    monkeypatch.setattr(gmail, "email_already_synced", not_synced)
+    inbox.extend(["msg-1", "msg-2"])
+    
+    body = (await client.get("/gmail/sync")).json()
+    
+    assert body["new_applications"] == 1
+    companies = [item["company"] for item in (await client.get("/jobs")).json()["items"]]
+    assert sorted(companies) == ["Company msg-2", "Concurrent"]
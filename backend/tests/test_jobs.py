@@ -0,0 +1,223 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import func, literal_column, text
+
+from app.database import engine, async_session_maker
+from app.models import JobApplication, JobApplicationArchive, JobStatus
+from app.services import archive
+from app.services.archive import archive_closed_jobs
+
+
+async def add_jobs(db, *jobs: dict) -> list[JobApplication]:
+    rows = [JobApplication(**job) for job in jobs]
+    db.add_all(rows)
+    await db.commit()
+    return rows
+
+
+async def test_list_projects_requested_fields(client, db):
+    await add_jobs(db, {"company": "Acme", "position": "Engineer", "notes": "long notes"})
+    
+    response = await client.get("/jobs", params={"fields": "company,status"})
+    
+    assert response.status_code == 200
+    assert response.json()["items"] == [{"id": 1, "company": "Acme", "status": "applied"}]
+
+
+async def test_list_returns_all_fields_by_default(client, db):
+    await add_jobs(db, {"company": "Acme", "position": "Engineer", "notes": "long notes"})
+    
+    item = (await client.get("/jobs")).json()["items"][0]
+    
+    assert item["notes"] == "long notes"
+    assert set(item) == {column.name for column in JobApplication.__table__.columns}
+
+
+async def test_list_rejects_unknown_fields(client):
+    response = await client.get("/jobs", params={"fields": "company,password"})
+    
+    assert response.status_code == 400
+    assert "password" in response.json()["detail"]
+
+
+async def test_list_search_is_case_insensitive_substring(client, db):
+    await add_jobs(
+        db,
+        {"company": "Acme Corp", "position": "Engineer"},
+        {"company": "Globex", "position": "Platform ACME liaison"},
+        {"company": "Initech", "position": "Analyst"},
+    )
+    
+    body = (await client.get("/jobs", params={"search": "acme", "fields": "company"})).json()
+    
+    assert body["total"] == 2
+    assert {item["company"] for item in body["items"]} == {"Acme Corp", "Globex"}
+
+
+async def test_list_filters_sorts_and_paginates(client, db):
+    now = datetime(2026, 1, 1)
+    await add_jobs(db, *[
+        {"company": f"Company {i}", "position": "Engineer", "status": JobStatus.INTERVIEWING,
+         "applied_date": now + timedelta(days=i)}
+        for i in range(5)
+    ], {"company": "Other", "position": "Engineer", "status": JobStatus.OFFER})
+    
+    body = (await client.get("/jobs", params={
+        "status": "interviewing", "skip": 1, "limit": 2, "fields": "company",
+    })).json()
+    
+    assert body["total"] == 5
+    assert [item["company"] for item in body["items"]] == ["Company 3", "Company 2"]
+
+
+async def test_list_includes_archive_on_request(client, db):
+    await add_jobs(
+        db,
+        {"company": "Closed", "position": "Engineer", "status": JobStatus.REJECTED},
+        {"company": "Open", "position": "Engineer"},
+    )
+    await archive_closed_jobs(db, older_than_days=-1)
+    
+    hot = (await client.get("/jobs", params={"fields": "company"})).json()
+    both = (await client.get("/jobs", params={"fields": "company", "include_archived": True})).json()
+    
+    assert [item["company"] for item in hot["items"]] == ["Open"]
+    assert both["total"] == 2
+    assert {item["company"] for item in both["items"]} == {"Closed", "Open"}
+
+
+async def test_create_job_conflicting_email_returns_409(client):
+    job = {"company": "Acme", "position": "Engineer", "email_id": "msg-1"}
+    
+    first = await client.post("/jobs", json=job)
+    second = await client.post("/jobs", json=job)
+    
+    assert first.status_code == 200
+    assert second.status_code == 409
+    assert (await client.get("/jobs")).json()["total"] == 1
+
+
+async def test_archive_moves_only_stale_closed_jobs_in_batches(db, monkeypatch):
+    monkeypatch.setattr(archive, "ARCHIVE_BATCH_SIZE", 2)
+    old = datetime.utcnow() - timedelta(days=60)
+    await add_jobs(db, *[
+        {"company": f"Rejected {i}", "position": "Engineer", "status": JobStatus.REJECTED, "updated_at": old}
+        for i in range(5)
+    ], 
+        {"company": "Recent", "position": "Engineer", "status": JobStatus.WITHDRAWN},
+        {"company": "Active", "position": "Engineer", "status": JobStatus.APPLIED, "updated_at": old},
+    )
+    
+    moved = await archive_closed_jobs(db, older_than_days=30)
+    
+    assert sorted(moved) == [1, 2, 3, 4, 5]
+    assert await db.get(JobApplicationArchive, 1) is not None
+    assert await db.get(JobApplication, 6) is not None
+    assert await db.get(JobApplication, 7) is not None
+
+
+async def test_update_restores_archived_job(client, db):
+    await add_jobs(db, {"company": "Closed", "position": "Engineer", "status": JobStatus.REJECTED})
+    await archive_closed_jobs(db, older_than_days=-1)
+    
+    response = await client.patch("/jobs/1", json={"status": "interviewing"})
+    
+    assert response.status_code == 200
+    assert response.json()["id"] == 1
+    items = (await client.get("/jobs", params={"fields": "company,status"})).json()["items"]
+    assert items == [{"id": 1, "company": "Closed", "status": "interviewing"}]
+    assert (await client.get("/jobs", params={"include_archived": True})).json()["total"] == 1
+
+
+async def test_list_documents_row_schema(client):
+    schema = (await client.get("/openapi.json")).json()
+    
+    response = schema["paths"]["/jobs"]["get"]["responses"]["200"]
+    assert response["content"]["application/json"]["schema"]["$ref"].endswith("/JobApplicationList")
+    row = schema["components"]["schemas"]["JobApplicationListItem"]
+    assert row["required"] == ["id"]
+
+
+async def test_create_job_with_archived_email_returns_409(client, db):
+    await add_jobs(db, {"company": "Closed", "position": "Engineer", "status": JobStatus.REJECTED, "email_id": "m1"})
+    await archive_closed_jobs(db, older_than_days=-1)
+    
+    response = await client.post("/jobs", json={"company": "Again", "position": "Engineer", "email_id": "m1"})
+    
+    assert response.status_code == 409
+    assert (await client.get("/jobs", params={"include_archived": True})).json()["total"] == 1
+
+
+async def test_restore_onto_hot_duplicate_email_returns_409(client, db):
+    await add_jobs(db, {"company": "Closed", "position": "Engineer", "status": JobStatus.REJECTED, "email_id": "m1"})
+    await archive_closed_jobs(db, older_than_days=-1)
+    # e.g. synced again in the window between a dedup check and the archive move
+    await add_jobs(db, {"company": "Duplicate", "position": "Engineer", "email_id": "m1"})
+    
+    response = await client.patch("/jobs/1", json={"status": "interviewing"})
+    
+    assert response.status_code == 409
+    assert await db.get(JobApplicationArchive, 1) is not None
+
+
+async def test_archive_skips_rows_whose_email_is_already_archived(db):
+    await add_jobs(db, {"company": "First", "position": "Engineer", "status": JobStatus.REJECTED, "email_id": "m1"})
+    await archive_closed_jobs(db, older_than_days=-1)
+    await add_jobs(
+        db,
+        {"company": "Duplicate", "position": "Engineer", "status": JobStatus.REJECTED, "email_id": "m1"},
+        {"company": "Other", "position": "Engineer", "status": JobStatus.WITHDRAWN, "email_id": "m2"},
+    )
+    
+    moved = await archive_closed_jobs(db, older_than_days=-1)
+    
+    assert moved == [3]
+    assert await db.get(JobApplication, 2) is not None
+    # The duplicate doesn't wedge later runs
+    assert await archive_closed_jobs(db, older_than_days=-1) == []
+
+
+@pytest.fixture
+async def server_behind_utc(dialect):
+    """A PostgreSQL server 12 hours behind UTC, so updated_at holds local wall-clock time."""
+    if dialect != "postgresql":
+        pytest.skip("SQLite timestamps are always UTC")
+    
+    async def set_timezone(clause):
+        async with engine.begin() as conn:
+            name = (await conn.execute(text("SELECT current_database()"))).scalar()
+            await conn.execute(text(f'ALTER DATABASE "{name}" {clause}'))
+        # New connections pick up the database default
+        await engine.dispose()
+    
+    await set_timezone("SET timezone TO 'Etc/GMT+12'")
+    yield
+    await set_timezone("RESET timezone")
+
+
+async def assert_only_stale_row_archived(db, recent, stale):
+    jobs = [
+        JobApplication(company="Recent", position="Engineer", status=JobStatus.REJECTED, updated_at=recent),
+        JobApplication(company="Stale", position="Engineer", status=JobStatus.REJECTED, updated_at=stale),
+    ]
+    db.add_all(jobs)
+    await db.commit()
+    
+    moved = await archive_closed_jobs(db, older_than_days=1)
+    
+    assert moved == [jobs[1].id]
+
+
+async def test_archive_age_uses_database_clock(db):
+    now = datetime.utcnow()
+    await assert_only_stale_row_archived(db, now - timedelta(hours=18), now - timedelta(hours=30))
+
+
+async def test_archive_age_on_server_outside_utc(migrated_db, server_behind_utc):
+    async with async_session_maker() as db:
+        await assert_only_stale_row_archived(
+            db,
+            func.localtimestamp() - literal_column("interval '18 hours'"),
+            func.localtimestamp() - literal_column("interval '30 hours'"),
+        )
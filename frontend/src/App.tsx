@@ -11,11 +11,16 @@ import {
   LogIn,
   LogOut,
 } from "lucide-react";
-import { JobTable } from "./components/JobTable";
+import {
+  JobTable,
+  JOB_TABLE_FIELDS,
+  type JobTableRow,
+} from "./components/JobTable";
 import { StatsCard } from "./components/StatsCard";
 import { AddJobModal } from "./components/AddJobModal";
 import {
   getJobs,
+  getJob,
   getAuthStatus,
   getLoginUrl,
   logout,
@@ -23,7 +28,9 @@ import {
   createJob,
   updateJob,
   deleteJob,
+  subscribeToJobEvents,
   type JobApplication,
+  type JobApplicationList,
   type JobStatus,
 } from "./services/api";
 
@@ -50,9 +57,61 @@ function App() {
 
   const { data: jobsData, isLoading } = useQuery({
     queryKey: ["jobs"],
-    queryFn: () => getJobs().then((r) => r.data),
+    queryFn: () =>
+      getJobs<JobTableRow>({ fields: JOB_TABLE_FIELDS.join(",") }).then(
+        (r) => r.data
+      ),
   });
 
+  // Apply live changes from the server instead of refetching the list.
+  // Resubscribes only when a fresh snapshot arrives with a new version.
+  const snapshotVersion = jobsData?.version;
+  useEffect(() => {
+    if (snapshotVersion === undefined) return;
+    return subscribeToJobEvents(snapshotVersion, (event) => {
+      if (event.type === "reset") {
+        queryClient.invalidateQueries({ queryKey: ["jobs"] });
+        return;
+      }
+      if (event.type === "deleted" || event.type === "archived") {
+        const removed = event.type === "deleted" ? [event.id] : event.ids;
+        queryClient.setQueryData<JobApplicationList<JobTableRow>>(
+          ["jobs"],
+          (old) => {
+            if (!old) return old;
+            const items = old.items.filter((j) => !removed.includes(j.id));
+            return {
+              ...old,
+              items,
+              total: old.total - (old.items.length - items.length),
+            };
+          }
+        );
+        return;
+      }
+      // Rows edited in place keep their position; a new row, or one whose
+      // applied_date moved, may belong on another page, so ask the server
+      const cached = queryClient.getQueryData<
+        JobApplicationList<JobTableRow>
+      >(["jobs"]);
+      const current = cached?.items.find((j) => j.id === event.job.id);
+      if (!current || current.applied_date !== event.job.applied_date) {
+        queryClient.invalidateQueries({ queryKey: ["jobs"] });
+        return;
+      }
+      queryClient.setQueryData<JobApplicationList<JobTableRow>>(
+        ["jobs"],
+        (old) =>
+          old && {
+            ...old,
+            items: old.items.map((j) =>
+              j.id === event.job.id ? event.job : j
+            ),
+          }
+      );
+    });
+  }, [queryClient, snapshotVersion]);
+
   // Mutations
   const loginMutation = useMutation({
     mutationFn: getLoginUrl,
@@ -72,7 +131,6 @@ function App() {
     mutationFn: syncEmails,
     onSuccess: (response) => {
       setSyncMessage(response.data.message);
-      queryClient.invalidateQueries({ queryKey: ["jobs"] });
       setTimeout(() => setSyncMessage(null), 5000);
     },
     onError: (error: any) => {
@@ -84,7 +142,6 @@ function App() {
   const createMutation = useMutation({
     mutationFn: createJob,
     onSuccess: () => {
-      queryClient.invalidateQueries({ queryKey: ["jobs"] });
       setIsModalOpen(false);
     },
   });
@@ -93,7 +150,6 @@ function App() {
     mutationFn: ({ id, data }: { id: number; data: Partial<JobApplication> }) =>
       updateJob(id, data),
     onSuccess: () => {
-      queryClient.invalidateQueries({ queryKey: ["jobs"] });
       setIsModalOpen(false);
       setEditingJob(null);
     },
@@ -101,9 +157,6 @@ function App() {
 
   const deleteMutation = useMutation({
     mutationFn: deleteJob,
-    onSuccess: () => {
-      queryClient.invalidateQueries({ queryKey: ["jobs"] });
-    },
   });
 
   // Stats calculation
@@ -118,8 +171,10 @@ function App() {
     rejected: jobs.filter((j) => j.status === "rejected").length,
   };
 
-  const handleEdit = (job: JobApplication) => {
-    setEditingJob(job);
+  // The list only carries table columns, so load the full row for editing
+  const handleEdit = async (id: number) => {
+    const { data } = await getJob(id);
+    setEditingJob(data);
     setIsModalOpen(true);
   };
 
@@ -19,11 +19,26 @@ import {
 import type { JobApplication, JobStatus } from "../services/api";
 import { StatusBadge } from "./StatusBadge";
 
-const columnHelper = createColumnHelper<JobApplication>();
+// Columns the table displays; the list endpoint is asked for only these
+export const JOB_TABLE_FIELDS = [
+  "company",
+  "position",
+  "status",
+  "source",
+  "applied_date",
+  "job_url",
+] as const;
+
+export type JobTableRow = Pick<
+  JobApplication,
+  "id" | (typeof JOB_TABLE_FIELDS)[number]
+>;
+
+const columnHelper = createColumnHelper<JobTableRow>();
 
 interface JobTableProps {
-  jobs: JobApplication[];
-  onEdit: (job: JobApplication) => void;
+  jobs: JobTableRow[];
+  onEdit: (id: number) => void;
   onDelete: (id: number) => void;
   onStatusChange: (id: number, status: JobStatus) => void;
 }
@@ -131,7 +146,7 @@ export function JobTable({
             </a>
           )}
           <button
-            onClick={() => onEdit(info.row.original)}
+            onClick={() => onEdit(info.row.original.id)}
             className="p-1.5 text-zinc-500 hover:text-blue-400 transition-colors"
           >
             <Pencil className="w-4 h-4" />
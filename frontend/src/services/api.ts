@@ -31,9 +31,11 @@ export type JobStatus =
   | "rejected"
   | "withdrawn";
 
-export interface JobApplicationList {
-  items: JobApplication[];
+// Rows only carry the columns requested through `fields`
+export interface JobApplicationList<T = JobApplication> {
+  items: T[];
   total: number;
+  version: number; // change feed position the list was read at
 }
 
 export interface AuthStatus {
@@ -47,12 +49,14 @@ export const getLoginUrl = () => api.get<{ auth_url: string }>("/auth/login");
 export const logout = () => api.post("/auth/logout");
 
 // Jobs endpoints
-export const getJobs = (params?: {
+export const getJobs = <T extends Partial<JobApplication> = JobApplication>(params?: {
   skip?: number;
   limit?: number;
   status?: JobStatus;
   search?: string;
-}) => api.get<JobApplicationList>("/jobs", { params });
+  fields?: string;
+  include_archived?: boolean;
+}) => api.get<JobApplicationList<T>>("/jobs", { params });
 
 export const getJob = (id: number) => api.get<JobApplication>(`/jobs/${id}`);
 
@@ -64,6 +68,36 @@ export const updateJob = (id: number, job: Partial<JobApplication>) =>
 
 export const deleteJob = (id: number) => api.delete(`/jobs/${id}`);
 
+export type JobEvent =
+  | { type: "created" | "updated"; job: JobApplication }
+  | { type: "deleted"; id: number }
+  | { type: "archived"; ids: number[] }
+  | { type: "reset" };
+
+// Starts after `version` from getJobs(); EventSource reconnects on its own and
+// sends Last-Event-ID to resume
+export const subscribeToJobEvents = (
+  version: number,
+  onEvent: (event: JobEvent) => void
+) => {
+  const source = new EventSource(
+    `${API_BASE}/jobs/events?last_event_id=${version}`,
+    { withCredentials: true }
+  );
+  const jobHandler = (type: "created" | "updated") => (e: MessageEvent) =>
+    onEvent({ type, job: JSON.parse(e.data) });
+  source.addEventListener("created", jobHandler("created"));
+  source.addEventListener("updated", jobHandler("updated"));
+  source.addEventListener("deleted", (e: MessageEvent) =>
+    onEvent({ type: "deleted", id: JSON.parse(e.data).id })
+  );
+  source.addEventListener("archived", (e: MessageEvent) =>
+    onEvent({ type: "archived", ids: JSON.parse(e.data).ids })
+  );
+  source.addEventListener("reset", () => onEvent({ type: "reset" }));
+  return () => source.close();
+};
+
 // Gmail endpoints
 export const syncEmails = () => api.get("/gmail/sync");
 export const testGmailConnection = () => api.get("/gmail/test");